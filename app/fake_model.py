@@ -1,14 +1,96 @@
+import os
+from functools import lru_cache
+
 import joblib
+import numpy as np
+import sklearn
+from scipy.special import expit
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer, TfidfVectorizer
+from sklearn.linear_model import LogisticRegression, SGDClassifier
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import normalize
 
-fake_model = joblib.load("models/fake_news.pkl")
-tfidf = joblib.load("models/tfidf.pkl")
 
-def predict_fake(text: str):
-    vector = tfidf.transform([text])
-    prob = fake_model.predict_proba(vector)[0][1]
+# scikit-learn 1.5 ships the sparse idf scaling below (PR #18843) along with
+# its own input validation, so the override is only needed on older releases
+_SKLEARN_HAS_SPARSE_IDF = tuple(int(p) for p in sklearn.__version__.split(".")[:2]) >= (1, 5)
+
+
+class _SparseIdfTransformer(TfidfTransformer):
+    # Scales the CSR data by idf in place instead of building a diagonal
+    # matrix and doing a sparse matmul (scikit-learn PR #18843).
+    def transform(self, X, copy=True):
+        X = X.copy() if copy else X
+        if not np.issubdtype(X.dtype, np.floating):
+            X = X.astype(np.float64)
+        if self.sublinear_tf:
+            np.log(X.data, X.data)
+            X.data += 1
+        if self.use_idf:
+            idf = self._idf_diag.data if hasattr(self, "_idf_diag") else self.idf_
+            X.data *= idf[X.indices]
+        if self.norm is not None:
+            X = normalize(X, norm=self.norm, copy=False)
+        return X
+
+
+@lru_cache(maxsize=1)
+def _get_pipe():
+    # Loaded on first use so processes that never call predict_fake skip it
+    fake_model = joblib.load("models/fake_news.pkl")
+    # Models trained before the switch to hashing saved a TfidfVectorizer
+    # under the old name
+    if os.path.exists("models/vectorizer.pkl"):
+        tfidf = joblib.load("models/vectorizer.pkl")
+    else:
+        tfidf = joblib.load("models/tfidf.pkl")
+
+    if isinstance(tfidf, TfidfVectorizer) and hasattr(tfidf, "_tfidf"):
+        if not _SKLEARN_HAS_SPARSE_IDF:
+            tfidf._tfidf.__class__ = _SparseIdfTransformer
+
+    # Run the vectorizer -> linear model path in float32 to halve the memory
+    # traffic of the sparse dot product
+    if hasattr(fake_model, "coef_"):
+        fake_model.coef_ = fake_model.coef_.astype(np.float32)
+        fake_model.intercept_ = np.asarray(fake_model.intercept_, dtype=np.float32)
+        if isinstance(tfidf, (HashingVectorizer, TfidfVectorizer)):
+            tfidf.dtype = np.float32
+        if isinstance(tfidf, TfidfVectorizer) and tfidf.use_idf and hasattr(tfidf, "_tfidf"):
+            # Before scikit-learn 1.5 the idf_ setter stores float64 again; the
+            # in-place idf scaling still leaves the matrix in float32
+            tfidf._tfidf.idf_ = tfidf._tfidf.idf_.astype(np.float32)
+
+    return make_pipeline(tfidf, fake_model)
+
+def _uses_logit(model):
+    # For binary logistic models P(fake) is exactly sigmoid(decision_function),
+    # which skips predict_proba's two-column array. Multinomial
+    # LogisticRegression and other classifiers calibrate differently.
+    if len(getattr(model, "classes_", ())) != 2:
+        return False
+    if isinstance(model, LogisticRegression):
+        return getattr(model, "multi_class", "auto") != "multinomial"
+    return isinstance(model, SGDClassifier) and model.loss in ("log_loss", "log")
+
+def _fake_probs(texts: list[str]):
+    pipe = _get_pipe()
+    if _uses_logit(pipe[-1]):
+        return expit(pipe.decision_function(texts))
+    return pipe.predict_proba(texts)[:, 1]
+
+def _fake_result(prob):
     label = "Fake" if prob > 0.5 else "Real"
 
     return {
         "label": label,
         "confidence": round(float(prob), 3)
     }
+
+def predict_fake(text: str):
+    return _fake_result(_fake_probs([text])[0])
+
+def predict_fake_batch(texts: list[str]):
+    # The whole batch is vectorized into one CSR matrix that flows straight
+    # into the classifier; no per-row slicing or densifying
+    return [_fake_result(p) for p in _fake_probs(texts)]
@@ -6,17 +6,36 @@ Falls back to curated static headlines when no API key is configured.
 """
 
 import os
+import time
 import asyncio
 import logging
 from datetime import datetime, timezone
-from urllib.parse import quote_plus
 
-import requests
+import httpx
 
 logger = logging.getLogger(__name__)
 
 _TIMEOUT = 8
 
+# Read once; app.main loads .env before importing this module
+_GNEWS_KEY = os.getenv("GNEWS_API_KEY", "").strip()
+
+_GNEWS_URL = "https://gnews.io/api/v4/top-headlines"
+
+# How long fetched headlines are served from memory before refetching
+_CACHE_TTL = 120
+
+# Shared client so the per-category requests reuse pooled connections
+_client = httpx.AsyncClient(
+    http2=True,
+    timeout=_TIMEOUT,
+    limits=httpx.Limits(max_keepalive_connections=16),
+)
+
+# Last fetched headlines; the lock ensures only one coroutine refetches
+_cache = {"ts": 0.0, "data": None}
+_cache_lock = asyncio.Lock()
+
 # Categories to fetch — one headline each
 CATEGORIES = ["politics", "technology", "business", "entertainment", "world"]
 
@@ -89,17 +108,13 @@ def _time_ago(published_at: str) -> str:
         return ""
 
 
-def _fetch_gnews_category(category: str, api_key: str) -> dict | None:
+async def _fetch_gnews_category(category: str, api_key: str) -> dict | None:
     """Fetch one headline for a single category from GNews."""
     try:
-        url = (
-            f"https://gnews.io/api/v4/top-headlines"
-            f"?category={quote_plus(category)}"
-            f"&lang=en"
-            f"&max=1"
-            f"&apikey={api_key}"
+        resp = await _client.get(
+            _GNEWS_URL,
+            params={"category": category, "lang": "en", "max": 1, "apikey": api_key},
         )
-        resp = requests.get(url, timeout=_TIMEOUT)
         resp.raise_for_status()
         data = resp.json()
         articles = data.get("articles", [])
@@ -121,32 +136,68 @@ def _fetch_gnews_category(category: str, api_key: str) -> dict | None:
         return None
 
 
+async def close_client() -> None:
+    """Close the shared HTTP client. Called on app shutdown."""
+    await _client.aclose()
+
+
+async def _fetch_all(api_key: str) -> list[dict]:
+    """Fetch every category concurrently, filling gaps from the fallbacks."""
+    fetched = await asyncio.gather(
+        *[_fetch_gnews_category(cat, api_key) for cat in CATEGORIES],
+        return_exceptions=True,
+    )
+
+    results = []
+    for cat, item in zip(CATEGORIES, fetched):
+        if item and not isinstance(item, BaseException):
+            results.append(item)
+        else:
+            # Use fallback for this category
+            fb = next(
+                (h for h in _FALLBACK_HEADLINES
+                 if h["category"] == CATEGORY_LABELS.get(cat, "")),
+                None,
+            )
+            if fb:
+                results.append(fb)
+    return results
+
+
+def _fresh_cache() -> list[dict] | None:
+    """Cached headlines if fetched within _CACHE_TTL, else None."""
+    # Check data too: monotonic() can be below _CACHE_TTL shortly after boot,
+    # which would make the initial ts of 0.0 look fresh
+    if _cache["data"] is None:
+        return None
+    if time.monotonic() - _cache["ts"] >= _CACHE_TTL:
+        return None
+    return _cache["data"]
+
+
 async def fetch_headlines() -> list[dict]:
     """
     Fetch one headline per category. Uses GNews if API key is set,
     otherwise returns static fallback headlines.
-    """
-    api_key = os.getenv("GNEWS_API_KEY", "").strip()
 
-    if not api_key:
+    Results are cached for _CACHE_TTL seconds so concurrent callers
+    share a single upstream fetch.
+    """
+    if not _GNEWS_KEY:
         logger.info("Headlines: No GNews API key, using fallback")
         return _FALLBACK_HEADLINES
 
-    def _fetch_all():
-        results = []
-        for cat in CATEGORIES:
-            item = _fetch_gnews_category(cat, api_key)
-            if item:
-                results.append(item)
-            else:
-                # Use fallback for this category
-                fb = next(
-                    (h for h in _FALLBACK_HEADLINES
-                     if h["category"] == CATEGORY_LABELS.get(cat, "")),
-                    None,
-                )
-                if fb:
-                    results.append(fb)
-        return results
+    cached = _fresh_cache()
+    if cached is not None:
+        return cached
+
+    async with _cache_lock:
+        # Another coroutine may have refreshed the cache while we waited
+        cached = _fresh_cache()
+        if cached is not None:
+            return cached
 
-    return await asyncio.to_thread(_fetch_all)
+        results = await _fetch_all(_GNEWS_KEY)
+        _cache["data"] = results
+        _cache["ts"] = time.monotonic()
+        return results
@@ -1,18 +1,29 @@
 from dotenv import load_dotenv
 load_dotenv()
 
-from fastapi import FastAPI
+import os
+import asyncio
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 
-from .preprocessing import clean_text, spacy_doc
+from .preprocessing import clean_text, spacy_docs
 from .style_features import extract_style_features
-from .fake_model import predict_fake
-from .source_model import predict_source
+from .fake_model import predict_fake_batch
+from .source_model import predict_source_batch
 from .impersonation import check_impersonation
-from .scraper import scrape_verify
-from .headlines import fetch_headlines
+from .scraper import scrape_verify, close_client as close_scraper_client
+from .headlines import fetch_headlines, close_client as close_headlines_client
+
+logger = logging.getLogger(__name__)
 
+# Endpoints declare return types so FastAPI serializes responses straight to
+# JSON bytes through Pydantic instead of via jsonable_encoder
 app = FastAPI(title="Fake News & Source Impersonation API")
 
 # CORS configuration 
@@ -24,6 +35,11 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.on_event("shutdown")
+async def close_http_clients():
+    await close_scraper_client()
+    await close_headlines_client()
+
 class NewsRequest(BaseModel):
     title: str
     content: str
@@ -32,41 +48,177 @@ class NewsRequest(BaseModel):
 class ScrapeRequest(BaseModel):
     content: str
 
-@app.post("/analyze")
-def analyze_news(req: NewsRequest):
+# Concurrent /analyze requests arriving within _BATCH_WINDOW seconds are
+# coalesced into one model call of at most _MAX_BATCH items
+_MAX_BATCH = 32
+_BATCH_WINDOW = 0.005
+
+# spaCy's default nlp.max_length; longer content makes nlp.pipe raise E088
+_MAX_CONTENT_CHARS = 1_000_000
+
+# Upper bound on how long /analyze waits for its batch result
+_ANALYZE_TIMEOUT = 60
+
+def _analyze_batch(items: list[tuple[str, str, str]]) -> list[dict]:
     # Combine title and content for fake news detection
-    full_text = req.title + " " + req.content
-    cleaned = clean_text(full_text)
+    cleaned = [clean_text(title + " " + content) for title, content, _ in items]
+    fake_results = predict_fake_batch(cleaned)
 
     # Style analysis uses content only
-    doc = spacy_doc(req.content)
-    style_vector = extract_style_features(doc)
-
-    # Predictions
-    fake_result = predict_fake(cleaned)
-    source_result = predict_source(style_vector)
-
-    # Impersonation check
-    impersonation = check_impersonation(
-        source_result["predicted_source"],
-        req.claimed_source,
-        source_result["confidence"]
-    )
-
-    return {
-        "fake_news": fake_result,
-        "style_analysis": source_result,
-        "impersonation_detected": impersonation,
-        "claimed_source": req.claimed_source
-    }
+    docs = spacy_docs([content for _, content, _ in items])
+    style_vectors = np.stack([extract_style_features(doc) for doc in docs])
+    source_results = predict_source_batch(style_vectors)
+
+    results = []
+    for (_, _, claimed_source), fake_result, source_result in zip(
+        items, fake_results, source_results
+    ):
+        # Impersonation check
+        impersonation = check_impersonation(
+            source_result["predicted_source"],
+            claimed_source,
+            source_result["confidence"]
+        )
+
+        results.append({
+            "fake_news": fake_result,
+            "style_analysis": source_result,
+            "impersonation_detected": impersonation,
+            "claimed_source": claimed_source
+        })
+    return results
+
+def _warm_worker():
+    # Run one throwaway analysis so the lazily loaded spaCy pipeline and models
+    # are ready at worker start instead of on the first real request (the
+    # TextBlob lexicon is already loaded when style_features is imported)
+    _analyze_batch([("warmup", "This is a warmup sentence.", "")])
+
+def _noop():
+    pass
+
+# Inference processes per server process. Every uvicorn worker gets its own
+# pool, so the host runs workers x pool size of them in total; lower this when
+# running several workers.
+_CPU_POOL_SIZE = max(1, int(os.getenv("ANALYZE_POOL_SIZE") or os.cpu_count() or 1))
+
+def _new_cpu_pool():
+    return ProcessPoolExecutor(max_workers=_CPU_POOL_SIZE, initializer=_warm_worker)
+
+# CPU-bound inference runs in separate processes to sidestep the GIL
+_cpu_pool = _new_cpu_pool()
+
+_analyze_queue: asyncio.Queue = asyncio.Queue()
+_batcher_task: asyncio.Task | None = None
+_pending_batches: set[asyncio.Task] = set()
+
+async def _prime_cpu_pool():
+    # ProcessPoolExecutor only starts workers on the first submit; push one
+    # no-op per worker so they all start (and run _warm_worker) at startup
+    # rather than inside the first real request
+    pool = _cpu_pool
+    loop = asyncio.get_running_loop()
+    try:
+        await asyncio.gather(
+            *[loop.run_in_executor(pool, _noop) for _ in range(_CPU_POOL_SIZE)]
+        )
+    except Exception as e:
+        logger.warning(f"Warming the inference pool failed: {e}")
+
+def _replace_broken_pool(broken: ProcessPoolExecutor):
+    global _cpu_pool
+    # Several in-flight batches may see the same broken pool; replace it once
+    if _cpu_pool is broken:
+        logger.warning("Inference pool broke; starting a new one")
+        broken.shutdown(wait=False, cancel_futures=True)
+        _cpu_pool = _new_cpu_pool()
+        task = asyncio.create_task(_prime_cpu_pool())
+        _pending_batches.add(task)
+        task.add_done_callback(_pending_batches.discard)
+
+async def _run_batch(batch):
+    loop = asyncio.get_running_loop()
+    pool = _cpu_pool
+    try:
+        results = await loop.run_in_executor(
+            pool, _analyze_batch, [item for item, _ in batch]
+        )
+    except BrokenProcessPool as e:
+        # A worker died or its initializer failed. Start a fresh pool for later
+        # requests; retrying this batch could just break the new one again.
+        _replace_broken_pool(pool)
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(e)
+        return
+    except Exception as e:
+        if len(batch) == 1:
+            _, future = batch[0]
+            if not future.done():
+                future.set_exception(e)
+        else:
+            # Retry one by one so a bad input only fails its own request
+            await asyncio.gather(*[_run_batch([entry]) for entry in batch])
+        return
+    for (_, future), result in zip(batch, results):
+        if not future.done():
+            future.set_result(result)
+
+async def _batcher():
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await _analyze_queue.get()]
+        deadline = loop.time() + _BATCH_WINDOW
+        while len(batch) < _MAX_BATCH:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(_analyze_queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        # Dispatch without waiting so the next batch can fill meanwhile
+        task = asyncio.create_task(_run_batch(batch))
+        _pending_batches.add(task)
+        task.add_done_callback(_pending_batches.discard)
+
+@app.on_event("startup")
+async def start_batcher():
+    global _batcher_task
+    _batcher_task = asyncio.create_task(_batcher())
+    await _prime_cpu_pool()
+
+@app.on_event("shutdown")
+def shutdown_cpu_pool():
+    if _batcher_task is not None:
+        _batcher_task.cancel()
+    _cpu_pool.shutdown(wait=False, cancel_futures=True)
+
+@app.post("/analyze")
+async def analyze_news(req: NewsRequest) -> dict:
+    if len(req.content) > _MAX_CONTENT_CHARS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Content exceeds {_MAX_CONTENT_CHARS} characters",
+        )
+    if _batcher_task is None or _batcher_task.done():
+        raise HTTPException(status_code=503, detail="Analysis worker is not running")
+
+    future = asyncio.get_running_loop().create_future()
+    await _analyze_queue.put(((req.title, req.content, req.claimed_source), future))
+    try:
+        return await asyncio.wait_for(future, _ANALYZE_TIMEOUT)
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=504, detail="Analysis timed out")
 
 @app.post("/scrape-verify")
-async def scrape_verify_news(req: ScrapeRequest):
+async def scrape_verify_news(req: ScrapeRequest) -> dict:
     result = await scrape_verify(req.content)
     return result
 
 @app.get("/headlines")
-async def get_headlines():
+async def get_headlines() -> dict:
     headlines = await fetch_headlines()
     return {"headlines": headlines}
 
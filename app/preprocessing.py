@@ -1,20 +1,41 @@
 import re
+from functools import lru_cache
+
 import spacy
 import nltk
 from nltk.corpus import stopwords
 
 nltk.download("stopwords")
-STOP_WORDS = set(stopwords.words("english"))
+STOP_WORDS = frozenset(stopwords.words("english"))
+
+# Style features only need POS tags and sentence boundaries. The other
+# components are excluded rather than disabled so their weights are never
+# loaded; attribute_ruler stays because it maps tags onto token.pos_.
+@lru_cache(maxsize=1)
+def _get_nlp():
+    return spacy.load("en_core_web_sm", exclude=["ner", "lemmatizer"])
+
+# URLs and non-letter characters, stripped in a single pass over lowercased text
+_CLEAN_RE = re.compile(r"http\S+|[^a-z\s]")
 
-nlp = spacy.load("en_core_web_sm")
+# Retried requests often resend the same text; inputs longer than this
+# are cleaned without caching to keep the memo's memory bounded
+_MAX_CACHED_LEN = 16 * 1024
+
+def _clean_text(text: str) -> str:
+    text = _CLEAN_RE.sub("", text.lower())
+    sw = STOP_WORDS
+    return " ".join(t for t in text.split() if t not in sw)
+
+_clean_text_cached = lru_cache(maxsize=1024)(_clean_text)
 
 def clean_text(text: str) -> str:
-    text = text.lower()
-    text = re.sub(r"http\S+", "", text)
-    text = re.sub(r"[^a-zA-Z\s]", "", text)
-    tokens = text.split()
-    tokens = [t for t in tokens if t not in STOP_WORDS]
-    return " ".join(tokens)
+    if len(text) > _MAX_CACHED_LEN:
+        return _clean_text(text)
+    return _clean_text_cached(text)
 
 def spacy_doc(text: str):
-    return nlp(text)
+    return _get_nlp()(text)
+
+def spacy_docs(texts: list[str]):
+    return list(_get_nlp().pipe(texts, batch_size=32))
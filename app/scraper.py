@@ -7,11 +7,15 @@ to cross-reference news claims and produce a REAL / FAKE / UNVERIFIED verdict.
 
 import os
 import re
+import time
 import asyncio
 import logging
-from urllib.parse import urlparse, quote_plus
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from urllib.parse import urlparse
 
-import requests
+import httpx
 
 logger = logging.getLogger(__name__)
 
@@ -27,8 +31,38 @@ _HEADERS = {
 }
 _TIMEOUT = 10
 
+# API keys are read once; app.main loads .env before importing this module
+_GNEWS_KEY = os.getenv("GNEWS_API_KEY", "").strip()
+_FACTCHECK_KEY = os.getenv("GOOGLE_FACTCHECK_API_KEY", "").strip()
+
+_GNEWS_SEARCH_URL = "https://gnews.io/api/v4/search"
+_FACTCHECK_URL = "https://factchecktools.googleapis.com/v1alpha1/claims:search"
+
+# Inputs longer than this bypass the _build_query memo to bound its memory
+_MAX_CACHED_QUERY_INPUT = 16 * 1024
+
+# Verdicts for recent queries, so repeated (e.g. viral) claims skip the
+# providers entirely. Maps query -> (timestamp, result), oldest first.
+_VERDICT_CACHE_TTL = 1800
+_VERDICT_CACHE_SIZE = 1024
+_verdict_cache: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+# Lookups still running, so concurrent misses for one query share a fetch
+_verdict_inflight: dict[str, asyncio.Task] = {}
+
+# Shared client for the REST providers; closed on app shutdown
+_client = httpx.AsyncClient(
+    http2=True,
+    timeout=_TIMEOUT,
+    headers=_HEADERS,
+    limits=httpx.Limits(max_keepalive_connections=32),
+)
+
+# DuckDuckGo has no async client, so its blocking searches run here. Bounded
+# so bursts of verifications can't flood DDG or exhaust file descriptors.
+_ddg_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="ddg")
+
 # Reputable news domains get higher credibility weight
-_REPUTABLE_DOMAINS = {
+_REPUTABLE_DOMAINS = frozenset({
     "reuters.com", "apnews.com", "bbc.com", "bbc.co.uk",
     "nytimes.com", "washingtonpost.com", "theguardian.com",
     "cnn.com", "aljazeera.com", "npr.org", "pbs.org",
@@ -38,10 +72,18 @@ _REPUTABLE_DOMAINS = {
     "hindustantimes.com", "indianexpress.com",
     "snopes.com", "factcheck.org", "politifact.com",
     "fullfact.org", "boomlive.in", "altnews.in",
-}
+})
+
+# Fact-check rating keywords. Fake is tested first so that e.g. "not true"
+# or "mostly false" never fall through to the real pattern.
+_FAKE_RATING_RE = re.compile(
+    r"false|fake|pants on fire|incorrect|misleading|not true|hoax|"
+    r"fabricated|satire|scam"
+)
+_REAL_RATING_RE = re.compile(r"true|correct|accurate|verified|confirmed|real")
 
 # Common stop words to strip from search queries
-_STOP_WORDS = {
+_STOP_WORDS = frozenset({
     "the", "a", "an", "is", "are", "was", "were", "be", "been", "being",
     "have", "has", "had", "do", "does", "did", "will", "would", "shall",
     "should", "may", "might", "must", "can", "could", "this", "that",
@@ -56,35 +98,30 @@ _STOP_WORDS = {
     "of", "on", "or", "out", "over", "then", "to", "under", "up",
     "with", "as", "at", "also", "here", "there", "won", "won't",
     "don", "don't", "doesn", "doesn't", "didn", "didn't",
-}
+})
+
+# URLs and special characters (except basic punctuation), blanked in one pass
+_QUERY_CLEAN_RE = re.compile(r"https?://\S+|[^\w\s'-]")
 
 
 # ---------------------------------------------------------------------------
 # Query Builder — Extract the most important keywords
 # ---------------------------------------------------------------------------
 
-def _build_query(text: str) -> str:
+def _build_query_uncached(text: str) -> str:
     """
     Build a concise search query from news text.
     Extracts the most meaningful keywords (max 8-10 words).
     """
-    text = text.strip()
-
-    # Remove URLs
-    text = re.sub(r"https?://\S+", "", text)
-    # Remove special characters except spaces and basic punctuation
-    text = re.sub(r"[^\w\s'-]", " ", text)
-    # Collapse whitespace
-    text = re.sub(r"\s+", " ", text).strip()
-
-    # Split into words and filter
-    words = text.split()
+    # Strip URLs and special characters, then split (collapses whitespace)
+    words = _QUERY_CLEAN_RE.sub(" ", text).split()
+    stop_words = _STOP_WORDS
     keywords = []
     for w in words:
         clean = w.strip("'-").lower()
         if len(clean) < 3:
             continue
-        if clean in _STOP_WORDS:
+        if clean in stop_words:
             continue
         keywords.append(w)  # Keep original case for proper nouns
         if len(keywords) >= 10:
@@ -97,55 +134,57 @@ def _build_query(text: str) -> str:
     return " ".join(keywords)
 
 
+_build_query_cached = lru_cache(maxsize=1024)(_build_query_uncached)
+
+
+def _build_query(text: str) -> str:
+    """Memoized _build_query_uncached, skipping the cache for huge inputs."""
+    if len(text) > _MAX_CACHED_QUERY_INPUT:
+        return _build_query_uncached(text)
+    return _build_query_cached(text)
+
+
 # ---------------------------------------------------------------------------
 # Provider 1: GNews API
 # ---------------------------------------------------------------------------
 
 async def _search_gnews(query: str) -> list[dict]:
     """Search GNews API for news articles. Requires GNEWS_API_KEY."""
-    api_key = os.getenv("GNEWS_API_KEY", "").strip()
-    if not api_key:
+    if not _GNEWS_KEY:
         logger.info("GNews: No API key configured, skipping")
         return []
 
-    def _fetch():
-        try:
-            # Use the search endpoint with a short query
-            url = (
-                f"https://gnews.io/api/v4/search"
-                f"?q={quote_plus(query)}"
-                f"&lang=en"
-                f"&max=10"
-                f"&apikey={api_key}"
-            )
-            logger.info(f"GNews request: q={query}")
-            resp = requests.get(url, timeout=_TIMEOUT)
-            resp.raise_for_status()
-            data = resp.json()
-
-            if data.get("errors"):
-                logger.warning(f"GNews API errors: {data['errors']}")
-                return []
-
-            results = []
-            for article in data.get("articles", []):
-                domain = urlparse(article.get("url", "")).netloc
-                results.append({
-                    "title": article.get("title", ""),
-                    "url": article.get("url", ""),
-                    "snippet": article.get("description", ""),
-                    "domain": domain,
-                    "provider": "gnews",
-                    "published_at": article.get("publishedAt", ""),
-                    "source_name": article.get("source", {}).get("name", ""),
-                })
-            logger.info(f"GNews returned {len(results)} results")
-            return results
-        except Exception as e:
-            logger.warning(f"GNews search failed: {e}")
+    try:
+        # Use the search endpoint with a short query
+        logger.info(f"GNews request: q={query}")
+        resp = await _client.get(
+            _GNEWS_SEARCH_URL,
+            params={"q": query, "lang": "en", "max": 10, "apikey": _GNEWS_KEY},
+        )
+        resp.raise_for_status()
+        data = resp.json()
+
+        if data.get("errors"):
+            logger.warning(f"GNews API errors: {data['errors']}")
             return []
 
-    return await asyncio.to_thread(_fetch)
+        results = []
+        for article in data.get("articles", []):
+            domain = urlparse(article.get("url", "")).netloc
+            results.append({
+                "title": article.get("title", ""),
+                "url": article.get("url", ""),
+                "snippet": article.get("description", ""),
+                "domain": domain,
+                "provider": "gnews",
+                "published_at": article.get("publishedAt", ""),
+                "source_name": article.get("source", {}).get("name", ""),
+            })
+        logger.info(f"GNews returned {len(results)} results")
+        return results
+    except Exception as e:
+        logger.warning(f"GNews search failed: {e}")
+        return []
 
 
 # ---------------------------------------------------------------------------
@@ -154,46 +193,43 @@ async def _search_gnews(query: str) -> list[dict]:
 
 async def _search_factcheck(query: str) -> list[dict]:
     """Search Google Fact Check Tools API. Requires GOOGLE_FACTCHECK_API_KEY."""
-    api_key = os.getenv("GOOGLE_FACTCHECK_API_KEY", "").strip()
-    if not api_key:
+    if not _FACTCHECK_KEY:
         logger.info("Google Fact Check: No API key configured, skipping")
         return []
 
-    def _fetch():
-        try:
-            url = (
-                f"https://factchecktools.googleapis.com/v1alpha1/claims:search"
-                f"?query={quote_plus(query)}"
-                f"&key={api_key}"
-                f"&languageCode=en"
-                f"&pageSize=10"
-            )
-            resp = requests.get(url, timeout=_TIMEOUT)
-            resp.raise_for_status()
-            data = resp.json()
-
-            results = []
-            for claim in data.get("claims", []):
-                for review in claim.get("claimReview", []):
-                    domain = urlparse(review.get("url", "")).netloc
-                    results.append({
-                        "title": review.get("title", claim.get("text", "")),
-                        "url": review.get("url", ""),
-                        "snippet": claim.get("text", ""),
-                        "domain": domain,
-                        "provider": "factcheck",
-                        "claim_text": claim.get("text", ""),
-                        "claimant": claim.get("claimant", ""),
-                        "rating": review.get("textualRating", ""),
-                        "publisher": review.get("publisher", {}).get("name", ""),
-                    })
-            logger.info(f"FactCheck returned {len(results)} results")
-            return results
-        except Exception as e:
-            logger.warning(f"Google Fact Check search failed: {e}")
-            return []
-
-    return await asyncio.to_thread(_fetch)
+    try:
+        resp = await _client.get(
+            _FACTCHECK_URL,
+            params={
+                "query": query,
+                "key": _FACTCHECK_KEY,
+                "languageCode": "en",
+                "pageSize": 10,
+            },
+        )
+        resp.raise_for_status()
+        data = resp.json()
+
+        results = []
+        for claim in data.get("claims", []):
+            for review in claim.get("claimReview", []):
+                domain = urlparse(review.get("url", "")).netloc
+                results.append({
+                    "title": review.get("title", claim.get("text", "")),
+                    "url": review.get("url", ""),
+                    "snippet": claim.get("text", ""),
+                    "domain": domain,
+                    "provider": "factcheck",
+                    "claim_text": claim.get("text", ""),
+                    "claimant": claim.get("claimant", ""),
+                    "rating": review.get("textualRating", ""),
+                    "publisher": review.get("publisher", {}).get("name", ""),
+                })
+        logger.info(f"FactCheck returned {len(results)} results")
+        return results
+    except Exception as e:
+        logger.warning(f"Google Fact Check search failed: {e}")
+        return []
 
 
 # ---------------------------------------------------------------------------
@@ -230,87 +266,105 @@ async def _search_duckduckgo(query: str) -> list[dict]:
             logger.warning(f"DuckDuckGo search failed: {e}")
             return []
 
-    return await asyncio.to_thread(_fetch)
+    return await asyncio.get_running_loop().run_in_executor(_ddg_pool, _fetch)
 
 
 # ---------------------------------------------------------------------------
 # Cross-Reference Engine
 # ---------------------------------------------------------------------------
 
+def _url_key(url: str) -> str:
+    """
+    Normalize a URL for deduplication: ignore scheme, a leading "www.",
+    default ports, trailing slashes and the fragment.
+    """
+    p = urlparse(url)
+    host = p.netloc.lower().removeprefix("www.").removesuffix(":80").removesuffix(":443")
+    path = p.path.rstrip("/")
+    return f"{host}{path}?{p.query}" if p.query else f"{host}{path}"
+
+
 def _deduplicate(sources: list[dict]) -> list[dict]:
     """Remove duplicate URLs, keeping the first occurrence."""
-    seen_urls = set()
-    unique = []
+    unique = {}
     for s in sources:
-        url = s.get("url", "").rstrip("/")
-        if url and url not in seen_urls:
-            seen_urls.add(url)
-            unique.append(s)
-    return unique
-
-
-def _compute_verdict(
-    all_sources: list[dict],
-    fact_checks: list[dict],
-    providers_used: list[str],
-) -> dict:
+        url = s.get("url", "")
+        if not url:
+            continue
+        key = _url_key(url)
+        if key not in unique:
+            unique[key] = s
+    return list(unique.values())
+
+
+def _is_reputable(domain: str) -> bool:
+    """Match the host or any parent domain exactly against _REPUTABLE_DOMAINS."""
+    parts = domain.lower().split(":", 1)[0].split(".")
+    return any(".".join(parts[i:]) in _REPUTABLE_DOMAINS for i in range(len(parts) - 1))
+
+
+def _fact_check_verdict(fact_checks: list[dict]) -> dict | None:
+    """
+    Verdict from existing fact-checks alone, or None if no rating
+    could be classified as true or false.
     """
-    Cross-reference all sources and fact-checks to produce a verdict.
+    # Single pass: only the counts and the first three publishers are used
+    fake_count = real_count = 0
+    fake_publishers = []
+    real_publishers = []
+    for fc in fact_checks:
+        rating = fc.get("rating", "").lower()
+        if _FAKE_RATING_RE.search(rating):
+            fake_count += 1
+            if fake_count <= 3:
+                fake_publishers.append(fc.get("publisher", "?"))
+        elif _REAL_RATING_RE.search(rating):
+            real_count += 1
+            if real_count <= 3:
+                real_publishers.append(fc.get("publisher", "?"))
+
+    if fake_count and not real_count:
+        confidence = min(0.95, 0.70 + 0.05 * fake_count)
+        publishers = ", ".join(set(fake_publishers))
+        return {
+            "verdict": "FAKE",
+            "confidence": round(confidence, 2),
+            "explanation": (
+                f"This claim has been fact-checked and rated FALSE by {fake_count} "
+                f"fact-checker(s) including: {publishers}."
+            ),
+        }
+
+    if real_count and not fake_count:
+        confidence = min(0.95, 0.70 + 0.05 * real_count)
+        publishers = ", ".join(set(real_publishers))
+        return {
+            "verdict": "REAL",
+            "confidence": round(confidence, 2),
+            "explanation": (
+                f"This claim has been fact-checked and rated TRUE by {real_count} "
+                f"fact-checker(s) including: {publishers}."
+            ),
+        }
+
+    if fake_count and real_count:
+        return {
+            "verdict": "FAKE" if fake_count > real_count else "REAL",
+            "confidence": 0.55,
+            "explanation": (
+                f"Mixed fact-check results: {fake_count} rated it false, "
+                f"{real_count} rated it true. Leaning towards the majority."
+            ),
+        }
+
+    return None
+
+
+def _news_verdict(all_sources: list[dict]) -> dict:
+    """
+    Verdict from news coverage, used when fact-checks do not settle it.
     Returns {verdict, confidence, explanation}.
     """
-    # --- Phase 1: Check existing fact-checks (strongest signal) ---
-    if fact_checks:
-        fake_ratings = []
-        real_ratings = []
-        for fc in fact_checks:
-            rating = fc.get("rating", "").lower()
-            if any(w in rating for w in [
-                "false", "fake", "pants on fire", "incorrect",
-                "misleading", "mostly false", "not true", "hoax",
-                "fabricated", "satire", "scam",
-            ]):
-                fake_ratings.append(fc)
-            elif any(w in rating for w in [
-                "true", "correct", "accurate", "mostly true",
-                "verified", "confirmed", "real",
-            ]):
-                real_ratings.append(fc)
-
-        if fake_ratings and not real_ratings:
-            confidence = min(0.95, 0.70 + 0.05 * len(fake_ratings))
-            publishers = ", ".join(set(fc.get("publisher", "?") for fc in fake_ratings[:3]))
-            return {
-                "verdict": "FAKE",
-                "confidence": round(confidence, 2),
-                "explanation": (
-                    f"This claim has been fact-checked and rated FALSE by {len(fake_ratings)} "
-                    f"fact-checker(s) including: {publishers}."
-                ),
-            }
-
-        if real_ratings and not fake_ratings:
-            confidence = min(0.95, 0.70 + 0.05 * len(real_ratings))
-            publishers = ", ".join(set(fc.get("publisher", "?") for fc in real_ratings[:3]))
-            return {
-                "verdict": "REAL",
-                "confidence": round(confidence, 2),
-                "explanation": (
-                    f"This claim has been fact-checked and rated TRUE by {len(real_ratings)} "
-                    f"fact-checker(s) including: {publishers}."
-                ),
-            }
-
-        if fake_ratings and real_ratings:
-            return {
-                "verdict": "FAKE" if len(fake_ratings) > len(real_ratings) else "REAL",
-                "confidence": 0.55,
-                "explanation": (
-                    f"Mixed fact-check results: {len(fake_ratings)} rated it false, "
-                    f"{len(real_ratings)} rated it true. Leaning towards the majority."
-                ),
-            }
-
-    # --- Phase 2: Analyze news sources (weaker signal) ---
     non_fc_sources = [s for s in all_sources if s.get("provider") != "factcheck"]
 
     if not non_fc_sources:
@@ -321,8 +375,7 @@ def _compute_verdict(
         }
 
     reputable_count = sum(
-        1 for s in non_fc_sources
-        if any(rd in s.get("domain", "") for rd in _REPUTABLE_DOMAINS)
+        1 for s in non_fc_sources if _is_reputable(s.get("domain", ""))
     )
     total = len(non_fc_sources)
 
@@ -374,33 +427,28 @@ def _compute_verdict(
         }
 
 
-# ---------------------------------------------------------------------------
-# Main Public Function
-# ---------------------------------------------------------------------------
-
-async def scrape_verify(news_text: str) -> dict:
-    """
-    Search multiple APIs, cross-reference results, and produce a verdict.
-    """
-    query = _build_query(news_text)
-    logger.info(f"Built search query: '{query}' (from {len(news_text)} chars of input)")
-
-    # Run all providers in parallel
-    gnews_task = _search_gnews(query)
-    factcheck_task = _search_factcheck(query)
-    ddg_task = _search_duckduckgo(query)
-
-    gnews_results, factcheck_results, ddg_results = await asyncio.gather(
-        gnews_task, factcheck_task, ddg_task
-    )
+async def _verify_query(query: str) -> dict:
+    """Query the providers for one search query and cache the verdict."""
+    # Existing fact-checks outrank news coverage, so ask the Fact Check API
+    # first and only query GNews and DuckDuckGo when its ratings do not settle
+    # the verdict. That spends no news quota on already fact-checked claims,
+    # at the cost of one fact-check round trip before the news searches.
+    factcheck_results = await _search_factcheck(query)
+    verdict_data = _fact_check_verdict(factcheck_results)
 
-    # Track which providers returned results
     providers_used = []
-    if os.getenv("GNEWS_API_KEY", "").strip():
-        providers_used.append("gnews")
-    if os.getenv("GOOGLE_FACTCHECK_API_KEY", "").strip():
+    if _FACTCHECK_KEY:
         providers_used.append("factcheck")
-    providers_used.append("duckduckgo")  # always attempted
+
+    if verdict_data is None:
+        gnews_results, ddg_results = await asyncio.gather(
+            _search_gnews(query), _search_duckduckgo(query)
+        )
+        if _GNEWS_KEY:
+            providers_used.insert(0, "gnews")
+        providers_used.append("duckduckgo")  # always attempted
+    else:
+        gnews_results, ddg_results = [], []
 
     # Merge and deduplicate
     all_sources = _deduplicate(gnews_results + ddg_results)
@@ -412,10 +460,10 @@ async def scrape_verify(news_text: str) -> dict:
         f"Merged: {len(all_sources)}"
     )
 
-    # Compute verdict
-    verdict_data = _compute_verdict(all_sources, factcheck_results, providers_used)
+    if verdict_data is None:
+        verdict_data = _news_verdict(all_sources)
 
-    return {
+    result = {
         "query_used": query,
         "verdict": verdict_data["verdict"],
         "confidence": verdict_data["confidence"],
@@ -425,3 +473,47 @@ async def scrape_verify(news_text: str) -> dict:
         "sources": all_sources,
         "sources_found": len(all_sources),
     }
+
+    # Don't cache empty results, which are usually provider outages
+    if factcheck_results or all_sources:
+        _verdict_cache[query] = (time.monotonic(), result)
+        _verdict_cache.move_to_end(query)
+        if len(_verdict_cache) > _VERDICT_CACHE_SIZE:
+            _verdict_cache.popitem(last=False)
+
+    return result
+
+
+# ---------------------------------------------------------------------------
+# Main Public Function
+# ---------------------------------------------------------------------------
+
+async def scrape_verify(news_text: str) -> dict:
+    """
+    Search multiple APIs, cross-reference results, and produce a verdict.
+    """
+    query = _build_query(news_text)
+    logger.info(f"Built search query: '{query}' (from {len(news_text)} chars of input)")
+
+    cached = _verdict_cache.get(query)
+    if cached and time.monotonic() - cached[0] < _VERDICT_CACHE_TTL:
+        _verdict_cache.move_to_end(query)
+        logger.info("Serving cached verdict")
+        return cached[1]
+
+    task = _verdict_inflight.get(query)
+    if task is None:
+        task = asyncio.create_task(_verify_query(query))
+        _verdict_inflight[query] = task
+        task.add_done_callback(lambda _: _verdict_inflight.pop(query, None))
+    else:
+        logger.info("Joining in-flight verification for the same query")
+
+    # Shielded so one caller disconnecting doesn't cancel the others' fetch
+    return await asyncio.shield(task)
+
+
+async def close_client() -> None:
+    """Close the shared HTTP client and DuckDuckGo pool. Called on app shutdown."""
+    await _client.aclose()
+    _ddg_pool.shutdown(wait=False, cancel_futures=True)
@@ -1,13 +1,28 @@
+from functools import lru_cache
+
 import joblib
 import numpy as np
 
-source_model = joblib.load("models/source_classifier.pkl")
+@lru_cache(maxsize=1)
+def _get_source_model():
+    return joblib.load("models/source_classifier.pkl")
 
 def predict_source(style_vector: np.ndarray):
-    probs = source_model.predict_proba([style_vector])[0]
-    idx = probs.argmax()
+    return predict_source_batch(style_vector)[0]
+
+def predict_source_batch(style_vectors: np.ndarray):
+    # Accepts one vector or a stack of them; one predict_proba call either way.
+    # HistGradientBoosting validates input as C-contiguous float64, so
+    # matching that here means sklearn never copies the batch.
+    source_model = _get_source_model()
+    X = np.ascontiguousarray(np.atleast_2d(style_vectors), dtype=np.float64)
+    probs = source_model.predict_proba(X)
+    idxs = probs.argmax(axis=1)
 
-    return {
-        "predicted_source": source_model.classes_[idx],
-        "confidence": round(float(probs[idx]), 3)
-    }
+    return [
+        {
+            "predicted_source": source_model.classes_[idx],
+            "confidence": round(float(p[idx]), 3)
+        }
+        for p, idx in zip(probs, idxs)
+    ]
@@ -1,35 +1,36 @@
 import numpy as np
+from spacy.attrs import IS_ALPHA, POS
+from spacy.symbols import ADJ, ADV, NOUN, PRON, VERB
 from textblob import TextBlob
 
+_POS_TAGS = (NOUN, VERB, ADJ, ADV, PRON)
+
+# TextBlob loads its sentiment lexicon on first use; pay that once at import
+# (inherited by forked workers) rather than on the first request
+_WARMUP = TextBlob("warmup").sentiment
+
 def extract_style_features(doc):
     sentences = list(doc.sents)
-    words = [t for t in doc if t.is_alpha]
 
-    if len(sentences) == 0 or len(words) == 0:
-        return np.zeros(9)
+    # One (n_tokens, 2) array instead of per-token attribute access
+    arr = doc.to_array([POS, IS_ALPHA])
+    is_alpha = arr[:, 1].astype(bool)
+    total_words = int(is_alpha.sum())
+
+    if len(sentences) == 0 or total_words == 0:
+        return np.zeros(9, dtype=np.float64)
 
-    sent_lengths = [len([t for t in s if t.is_alpha]) for s in sentences]
+    # Alpha-token count per sentence, summed between sentence start offsets
+    sent_lengths = np.add.reduceat(is_alpha.astype(np.int64), [s.start for s in sentences])
 
     avg_sent_len = np.mean(sent_lengths)
     std_sent_len = np.std(sent_lengths)
 
-    pos_counts = {
-        "NOUN": 0,
-        "VERB": 0,
-        "ADJ": 0,
-        "ADV": 0,
-        "PRON": 0
-    }
-
-    for token in words:
-        if token.pos_ in pos_counts:
-            pos_counts[token.pos_] += 1
-
-    total_words = len(words)
-    pos_ratios = [pos_counts[p] / total_words for p in pos_counts]
+    word_pos = arr[is_alpha, 0]
+    pos_ratios = [np.count_nonzero(word_pos == p) / total_words for p in _POS_TAGS]
 
-    polarity = TextBlob(doc.text).sentiment.polarity
-    subjectivity = TextBlob(doc.text).sentiment.subjectivity
+    sentiment = TextBlob(doc.text).sentiment
+    polarity, subjectivity = sentiment.polarity, sentiment.subjectivity
 
     features = [
         avg_sent_len,
@@ -39,4 +40,4 @@ def extract_style_features(doc):
         *pos_ratios
     ]
 
-    return np.array(features)
+    return np.asarray(features, dtype=np.float64)
@@ -1,52 +1,66 @@
 import pandas as pd
+import numpy as np
 import joblib
 import os
+from itertools import zip_longest
 
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.linear_model import LogisticRegression
-from sklearn.model_selection import train_test_split
+from scipy.sparse import vstack
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.linear_model import SGDClassifier
 from sklearn.metrics import classification_report
 
-# Load datasets
-fake_df = pd.read_csv("data/fake_news/Fake.csv")
-true_df = pd.read_csv("data/fake_news/True.csv")
+CHUNK_SIZE = 10_000
+EPOCHS = 5
 
-fake_df["label"] = 1
-true_df["label"] = 0
+# Stateless hashing vectorizer: no vocabulary to fit, store or look up
+hasher = HashingVectorizer(
+    n_features=2**18,
+    alternate_sign=False,
+    ngram_range=(1, 2),
+    stop_words="english"
+)
 
-df = pd.concat([fake_df, true_df])
-df = df.sample(frac=1, random_state=42).reset_index(drop=True)
+# Logistic regression trained incrementally with SGD
+model = SGDClassifier(loss="log_loss", random_state=42)
 
-# Combine title and text
-df["content"] = df["title"] + " " + df["text"]
+def iter_chunks(seed):
+    # Pair up chunks of both files so every partial_fit sees both classes
+    fake_chunks = pd.read_csv("data/fake_news/Fake.csv", chunksize=CHUNK_SIZE)
+    true_chunks = pd.read_csv("data/fake_news/True.csv", chunksize=CHUNK_SIZE)
+    for fake_df, true_df in zip_longest(fake_chunks, true_chunks):
+        parts = []
+        if fake_df is not None:
+            parts.append(fake_df.assign(label=1))
+        if true_df is not None:
+            parts.append(true_df.assign(label=0))
+        yield pd.concat(parts).sample(frac=1, random_state=seed)
 
-X = df["content"]
-y = df["label"]
+X_test = []
+y_test = []
 
-# TF-IDF
-tfidf = TfidfVectorizer(
-    max_features=5000,
-    stop_words="english"
-)
+# Train model, streaming the CSVs chunk by chunk
+for epoch in range(EPOCHS):
+    for df in iter_chunks(seed=epoch):
+        # Combine title and text
+        X = hasher.transform(df["title"] + " " + df["text"])
+        y = df["label"].to_numpy()
 
-X_vec = tfidf.fit_transform(X)
+        # Hold out every 5th row of each file (~20%) for evaluation
+        is_test = df.index.to_numpy() % 5 == 0
 
-# Train-test split
-X_train, X_test, y_train, y_test = train_test_split(
-    X_vec, y, test_size=0.2, random_state=42
-)
+        model.partial_fit(X[~is_test], y[~is_test], classes=[0, 1])
 
-# Train model
-model = LogisticRegression(max_iter=1000)
-model.fit(X_train, y_train)
+        if epoch == 0:
+            X_test.append(X[is_test])
+            y_test.append(y[is_test])
 
 # Evaluate
-y_pred = model.predict(X_test)
-print(classification_report(y_test, y_pred))
+y_pred = model.predict(vstack(X_test))
+print(classification_report(np.concatenate(y_test), y_pred))
 
 # Save models
 os.makedirs("models", exist_ok=True)
 joblib.dump(model, "models/fake_news.pkl")
-joblib.dump(tfidf, "models/tfidf.pkl")
+joblib.dump(hasher, "models/vectorizer.pkl")
 
-print("Fake news model saved")
\ No newline at end of file
+print("Fake news model saved")
@@ -3,15 +3,17 @@ import numpy as np
 import spacy
 import os
 import joblib
+import multiprocessing
 
-from sklearn.ensemble import RandomForestClassifier
+from sklearn.ensemble import HistGradientBoostingClassifier
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import classification_report
 
 from app.style_features import extract_style_features
 
-# Load spaCy
-nlp = spacy.load("en_core_web_sm")
+# Load spaCy with the same components as app/preprocessing.py so training
+# and inference features match (attribute_ruler supplies token.pos_)
+nlp = spacy.load("en_core_web_sm", exclude=["ner", "lemmatizer"])
 
 # Load dataset (JSON Lines!)
 df = pd.read_json(
@@ -38,18 +40,21 @@ df["content"] = (
 
 print("Total samples:", len(df))
 
-X = []
-y = []
+texts = df["content"].to_numpy()
+y = df["category"].to_numpy()
 
-# Extract style features
-for _, row in df.iterrows():
-    doc = nlp(row["content"])
-    features = extract_style_features(doc)
-    X.append(features)
-    y.append(row["category"])
+# Filled row by row instead of stacking a list of arrays at the end.
+# float64 is the dtype HistGradientBoosting bins from, so fit doesn't copy it.
+X = np.empty((len(texts), 9), dtype=np.float64)
+
+# Parse in parallel worker processes. Only safe with fork: spawn would
+# re-run this whole script in every worker.
+n_process = -1 if multiprocessing.get_start_method() == "fork" else 1
 
-X = np.array(X)
-y = np.array(y)
+# Extract style features
+docs = nlp.pipe(texts, batch_size=256, n_process=n_process)
+for i, doc in enumerate(docs):
+    X[i] = extract_style_features(doc)
 
 # Train-test split
 X_train, X_test, y_train, y_test = train_test_split(
@@ -59,9 +64,11 @@ X_train, X_test, y_train, y_test = train_test_split(
     stratify=y
 )
 
-# Train model
-model = RandomForestClassifier(
-    n_estimators=200,
+# Train model. Histogram-based boosting suits this small dense feature table:
+# much faster to fit and predict than a 200-tree forest, and a far smaller pickle.
+model = HistGradientBoostingClassifier(
+    max_iter=300,
+    learning_rate=0.1,
     random_state=42
 )
 